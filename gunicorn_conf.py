@@ -0,0 +1,15 @@
+import multiprocessing
+import os
+
+# Gunicorn configuration for production
+# Usage: gunicorn main:app -c gunicorn_conf.py
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# Uvicorn workers pick up uvloop and httptools automatically when installed
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Each worker re-imports the app, lower WEB_CONCURRENCY on small containers
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+
+keepalive = 5
@@ -1,39 +1,59 @@
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+
+import orjson
 
 from dotenv import load_dotenv
 load_dotenv()
-from shared.config.settings import settings
+from shared.config.settings import get_settings
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from typing import List
 
+settings = get_settings()
+
 app = FastAPI(
     title = settings.app_name,
     version = settings.api_version,
-    debug = settings.debug
+    debug = settings.debug,
+    default_response_class = ORJSONResponse
 )
 
+# Compress larger JSON bodies; small payloads are sent as-is.
+# The middleware rewrites response headers in place, so never return the
+# same Response object twice: cache the body bytes instead
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 
 # Welcome message endpoint
 class WelcomeResponse(BaseModel):
     """
     Response model for welcome message endpoint
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     message: str = Field(examples=["Welcome to Social Blog API"])
     version: str = Field(examples=["v1"])
     docs: str = Field(examples=["/docs"])
 
+# Body never changes, so it is serialized once at import time.
+# Only the bytes are cached: middleware mutates Response headers in place
+_WELCOME_BODY = orjson.dumps(
+    WelcomeResponse(
+        message = "Welcome to Social Blog API",
+        version = settings.api_version,
+        docs = "/docs"
+    ).model_dump()
+)
+
 @app.get("/", response_model=WelcomeResponse)
-def welcome_message() -> WelcomeResponse:
+async def welcome_message() -> Response:
     """
     Root endopoint - API Welcome Message
     """
-    return WelcomeResponse(
-        message = "Welcome to Social Blog API",
-        version = settings.api_version,
-        docs = "/docs"
-    )
+    return Response(content=_WELCOME_BODY, media_type="application/json")
 
 
 # Health check
@@ -41,15 +61,22 @@ class HealthResponse(BaseModel):
     """
     Response model for health check endpoint
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str = Field(examples=["ok"])
     app: str = Field(examples=["Social Blog"])
 
+# Body never changes, so it is serialized once at import time
+_HEALTH_BODY = orjson.dumps(
+    HealthResponse(
+        status = "ok",
+        app = settings.app_name
+    ).model_dump()
+)
+
 @app.get("/health", response_model=HealthResponse)
-def health_check():
+async def health_check() -> Response:
     """
     Health check endpoint for monitoring
     """
-    return HealthResponse(
-        status = "ok",
-        app = settings.app_name
-    )
\ No newline at end of file
+    return Response(content=_HEALTH_BODY, media_type="application/json")
\ No newline at end of file
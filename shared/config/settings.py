@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings (BaseSettings):
@@ -18,4 +20,9 @@ class Settings (BaseSettings):
     )
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the application settings, reading '.env' only once per process
+    """
+    return Settings()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from shared.config.settings import get_settings
+
+
+# Long enough for both payloads to cross the GZip minimum_size
+LONG_APP_NAME = "Social Blog API " * 40
+LONG_API_VERSION = "v1-" + "x" * 600
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """
+    Test client for an app built from oversized settings values
+    """
+    import main
+
+    monkeypatch.setenv("APP_NAME", LONG_APP_NAME)
+    monkeypatch.setenv("API_VERSION", LONG_API_VERSION)
+    get_settings.cache_clear()
+    yield TestClient(importlib.reload(main).app)
+
+    monkeypatch.undo()
+    get_settings.cache_clear()
+    importlib.reload(main)
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("/", {"message": "Welcome to Social Blog API", "version": LONG_API_VERSION, "docs": "/docs"}),
+    ("/health", {"status": "ok", "app": LONG_APP_NAME}),
+])
+def test_repeated_requests_with_mixed_encodings(client, path, expected):
+    """
+    Responses must not leak headers between requests
+    """
+    for _ in range(3):
+        for encoding in ("gzip", "identity"):
+            response = client.get(path, headers={"Accept-Encoding": encoding})
+
+            assert response.status_code == 200
+            assert response.json() == expected
+            if encoding == "gzip":
+                assert response.headers["content-encoding"] == "gzip"
+            else:
+                assert "content-encoding" not in response.headers